@@ -0,0 +1,471 @@
+import os
+import sys
+import stat
+import functools
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# json, shutil, traceback and datetime are imported lazily where needed:
+# for a tool that mostly waits on input() and syscalls, module import time
+# is a visible slice of total runtime.
+
+
+class _NoColor:
+    """Stands in for colorama's Fore/Style when output is not a terminal."""
+
+    def __getattr__(self, name):
+        return ""
+
+
+if sys.stdout.isatty():
+    try:
+        from colorama import Fore, Style, init
+        init()
+    except ImportError:
+        Fore = Style = _NoColor()
+else:
+    # Piped output: skip ANSI wrapping (and the colorama import) entirely.
+    Fore = Style = _NoColor()
+
+# Define emoji constants
+EMOJI = {
+    "FILE": "📄",
+    "FOLDER": "📁",
+    "DELETE": "🗑️",
+    "SUCCESS": "✅",
+    "ERROR": "❌",
+    "INFO": "ℹ️",
+    "RESET": "🔄",
+    "WARNING": "⚠️",
+}
+
+# Relative prefixes (under the home directory) that deletion is restricted to.
+# remove_path refuses anything that does not fall under one of these bases,
+# even if it somehow ends up in the candidate lists. Keyed by sys.platform.
+EXPECTED_BASES = {
+    "win32": (
+        os.path.join("AppData", "Roaming", "Cursor"),
+        os.path.join("AppData", "Roaming", "cursor-electron"),
+        os.path.join("AppData", "Local", "Cursor"),
+        os.path.join("AppData", "Local", "cursor-updater"),
+        ".cursor",
+    ),
+    "darwin": (
+        os.path.join("Library", "Application Support", "Cursor"),
+        os.path.join("Library", "Application Support", "cursor-updater"),
+        os.path.join("Library", "Caches", "Cursor"),
+        os.path.join("Library", "Caches", "com.cursor.Cursor"),
+        ".cursor",
+    ),
+    "linux": (
+        os.path.join(".config", "Cursor"),
+        os.path.join(".config", "cursor"),
+        os.path.join(".config", "cursor-electron"),
+        os.path.join(".cache", "Cursor"),
+        os.path.join(".cache", "cursor"),
+        os.path.join(".local", "share", "cursor"),
+        ".cursor",
+    ),
+}
+
+# Candidate paths as "/"-joined templates relative to the home directory,
+# keyed by sys.platform. Built once at import; get_os_paths instantiates them
+# for a given home without re-running a platform.system() branch (which can
+# cost a uname syscall) or repeated Path arithmetic.
+_PATH_TEMPLATES = {
+    "win32": {
+        "config_dirs": (
+            "AppData/Roaming/Cursor",
+            "AppData/Roaming/cursor-electron",
+            ".cursor",
+        ),
+        "cache_dirs": (
+            "AppData/Local/Cursor",
+            "AppData/Local/cursor-updater",
+            "AppData/Roaming/Cursor/Cache",
+            "AppData/Roaming/Cursor/Code Cache",
+            "AppData/Roaming/Cursor/GPUCache",
+            "AppData/Roaming/Cursor/CachedData",
+            "AppData/Roaming/Cursor/User/workspaceStorage",
+        ),
+        "state_files": (
+            "AppData/Roaming/Cursor/machineId",
+            "AppData/Roaming/Cursor/User/globalStorage/storage.json",
+            "AppData/Roaming/Cursor/User/globalStorage/state.vscdb",
+        ),
+        "machine_id_file": "AppData/Roaming/Cursor/machineId",
+        "storage_json": "AppData/Roaming/Cursor/User/globalStorage/storage.json",
+    },
+    "darwin": {
+        "config_dirs": (
+            "Library/Application Support/Cursor",
+            ".cursor",
+        ),
+        "cache_dirs": (
+            "Library/Caches/Cursor",
+            "Library/Caches/com.cursor.Cursor",
+            "Library/Application Support/cursor-updater",
+            "Library/Application Support/Cursor/Cache",
+            "Library/Application Support/Cursor/Code Cache",
+            "Library/Application Support/Cursor/GPUCache",
+            "Library/Application Support/Cursor/CachedData",
+            "Library/Application Support/Cursor/User/workspaceStorage",
+        ),
+        "state_files": (
+            "Library/Application Support/Cursor/machineId",
+            "Library/Application Support/Cursor/User/globalStorage/storage.json",
+            "Library/Application Support/Cursor/User/globalStorage/state.vscdb",
+        ),
+        "machine_id_file": "Library/Application Support/Cursor/machineId",
+        "storage_json": "Library/Application Support/Cursor/User/globalStorage/storage.json",
+    },
+    "linux": {
+        "config_dirs": (
+            ".config/Cursor",
+            ".config/cursor",
+            ".config/cursor-electron",
+            ".cursor",
+        ),
+        "cache_dirs": (
+            ".cache/Cursor",
+            ".cache/cursor",
+            ".local/share/cursor",
+            ".config/Cursor/Cache",
+            ".config/Cursor/Code Cache",
+            ".config/Cursor/GPUCache",
+            ".config/Cursor/CachedData",
+            ".config/Cursor/User/workspaceStorage",
+        ),
+        "state_files": (
+            ".config/cursor/machineid",
+            ".config/Cursor/machineId",
+            ".config/Cursor/User/globalStorage/storage.json",
+            ".config/Cursor/User/globalStorage/state.vscdb",
+        ),
+        "machine_id_file": ".config/cursor/machineid",
+        "storage_json": ".config/Cursor/User/globalStorage/storage.json",
+    },
+}
+
+
+def get_os_paths(home_dir: Path) -> Optional[dict]:
+    """Build the per-OS lists of Cursor paths to delete and recreate.
+
+    Returns a dict with "config_dirs", "cache_dirs", "state_files",
+    "machine_id_file", "storage_json" and "allowed_bases", or None when
+    the current OS is not supported.
+    """
+    return _get_os_paths_cached(sys.platform, os.fspath(home_dir))
+
+
+@functools.lru_cache(maxsize=4)
+def _get_os_paths_cached(platform_key: str, home_str: str) -> Optional[dict]:
+    # The candidate lists are fixed per (platform, home dir), so repeated
+    # calls (e.g. when used as a library) hit the cache instead of rebuilding
+    # dozens of Path objects.
+    template = _PATH_TEMPLATES.get(platform_key)
+    if template is None:
+        return None
+
+    home_dir = Path(home_str)
+    paths = {
+        key: [Path(home_dir, *rel.split("/")) for rel in template[key]]
+        for key in ("config_dirs", "cache_dirs", "state_files")
+    }
+    paths["machine_id_file"] = Path(home_dir, *template["machine_id_file"].split("/"))
+    paths["storage_json"] = Path(home_dir, *template["storage_json"].split("/"))
+    paths["allowed_bases"] = EXPECTED_BASES[platform_key]
+    return paths
+
+
+@functools.lru_cache(maxsize=1024)
+def is_safe_to_delete(full_path: str, home_prefix: str, allowed_bases: Tuple[str, ...]) -> bool:
+    """Check that a path lives inside the home directory under a known Cursor base.
+
+    Both paths arrive as strings, with home_prefix already carrying its
+    trailing separator, so the whole check is two C-level prefix compares
+    (str.startswith takes the tuple of bases at once) with no Path objects
+    or parts tuples built per call.
+    """
+    if not full_path.startswith(home_prefix):
+        return False
+    return full_path[len(home_prefix):].startswith(allowed_bases)
+
+
+# Per-path status prefixes, assembled once at import: the deletion workers
+# emit one of these per candidate, so the Fore/EMOJI lookups and f-string
+# assembly stay out of the hot loop.
+MSG_DELETED_FILE = f"{Fore.GREEN}{EMOJI['DELETE']} Deleted file: "
+MSG_DELETED_DIR = f"{Fore.GREEN}{EMOJI['DELETE']} Deleted directory: "
+MSG_SKIPPED_PATH = f"{Fore.YELLOW}{EMOJI['WARNING']} Skipping unexpected path: "
+MSG_DELETE_FAILED = f"{Fore.RED}{EMOJI['ERROR']} Failed to delete "
+_RESET = Style.RESET_ALL
+
+# Deletions run on a thread pool; serialize output so messages don't interleave.
+_print_lock = threading.Lock()
+
+
+def _safe_print(message: str) -> None:
+    # One stdout.write per message instead of print's argument handling and
+    # separate newline write, under our own lock.
+    with _print_lock:
+        sys.stdout.write(message + "\n")
+
+
+# Directories holding more than this many entries are handed to the OS-native
+# recursive deleter, which clears huge caches in one process instead of one
+# Python call per entry.
+_NATIVE_RMTREE_THRESHOLD = 64
+
+
+def _rmtree_native(root: str) -> bool:
+    """Delete a tree with the platform's native recursive remover.
+
+    Returns True only when the command ran and the directory is gone, so
+    callers can fall back to the Python walker otherwise.
+    """
+    if os.name == "nt":
+        cmd = ["cmd", "/c", "rd", "/s", "/q", root]
+    else:
+        cmd = ["rm", "-rf", "--", root]
+    try:
+        result = subprocess.run(cmd, check=False, capture_output=True)
+    except OSError:
+        return False
+    return result.returncode == 0 and not os.path.lexists(root)
+
+
+def _scandir_rmtree(root: str) -> None:
+    """Iteratively delete a directory tree using os.scandir.
+
+    Unlike shutil.rmtree, this reuses the file-type information cached on each
+    DirEntry from the directory scan, so clearing caches made of thousands of
+    small files (workspaceStorage, Code Cache) costs one syscall per entry
+    instead of three or four.
+    """
+    stack = [root]
+    while stack:
+        top = stack[-1]
+        subdirs = []
+        with os.scandir(top) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                else:
+                    # Regular files and symlinks alike; type comes from the
+                    # cached DirEntry, no extra stat needed.
+                    os.unlink(entry.path)
+        if subdirs:
+            stack.extend(subdirs)
+        else:
+            os.rmdir(top)
+            stack.pop()
+
+
+def _fast_rmtree(root: str) -> None:
+    """Delete a directory tree, picking the fastest available backend.
+
+    Trees with many entries go to rm -rf / rd, which is substantially faster
+    than per-entry deletion from Python; everything else (and any native
+    failure) goes through the scandir walker, with shutil.rmtree as the last
+    resort.
+    """
+    count = 0
+    with os.scandir(root) as it:
+        for _ in it:
+            count += 1
+            if count > _NATIVE_RMTREE_THRESHOLD:
+                break
+    if count > _NATIVE_RMTREE_THRESHOLD and _rmtree_native(root):
+        return
+    try:
+        _scandir_rmtree(root)
+    except OSError:
+        import shutil
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def remove_path(path_to_delete: Path, home_prefix: str, allowed_bases: Tuple[str, ...]) -> bool:
+    """Delete a single file or directory after validating it is safe to remove.
+
+    home_prefix is the home directory string including its trailing separator,
+    computed once by the caller and shared by every deletion worker.
+    """
+    # Stringify once; every consumer below (lstat, unlink, messages, the
+    # safety check) takes the string, so no further pathlib conversions run.
+    path_str = os.fspath(path_to_delete)
+
+    # One lstat answers existence, file-vs-dir and symlink in a single syscall,
+    # where the exists/is_file/is_symlink/is_dir cascade costs one stat each.
+    try:
+        st = os.lstat(path_str)
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        _safe_print(f"{MSG_DELETE_FAILED}{path_str}: {e}{_RESET}")
+        return False
+
+    if not is_safe_to_delete(path_str, home_prefix, allowed_bases):
+        _safe_print(MSG_SKIPPED_PATH + path_str + _RESET)
+        return False
+
+    try:
+        mode = st.st_mode
+        if stat.S_ISLNK(mode) or stat.S_ISREG(mode):
+            os.unlink(path_str)
+            _safe_print(MSG_DELETED_FILE + path_str + _RESET)
+        elif stat.S_ISDIR(mode):
+            _fast_rmtree(path_str)
+            _safe_print(MSG_DELETED_DIR + path_str + _RESET)
+        return True
+    except OSError as e:
+        _safe_print(f"{MSG_DELETE_FAILED}{path_str}: {e}{_RESET}")
+        return False
+
+
+def create_file_with_content(path: Path, content: str, created_dirs: Optional[set] = None) -> bool:
+    """Create a file (and its parent directories) with the given content.
+
+    created_dirs, when given, remembers parents made earlier in the same run
+    so makedirs does not re-walk the ancestry (a stat per component) for every
+    file dropped into the same directory.
+    """
+    try:
+        parent = os.fspath(path.parent)
+        if created_dirs is None or parent not in created_dirs:
+            os.makedirs(parent, exist_ok=True)
+            if created_dirs is not None:
+                created_dirs.add(parent)
+        # A raw open/write/close skips the TextIOWrapper buffering layer that
+        # path.write_text sets up for what is a single small write.
+        fd = os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, content.encode("utf-8"))
+        finally:
+            os.close(fd)
+        print(f"{Fore.GREEN}{EMOJI['FILE']} Created: {path}{Style.RESET_ALL}")
+        return True
+    except OSError as e:
+        print(f"{Fore.RED}{EMOJI['ERROR']} Failed to create {path}: {e}{Style.RESET_ALL}")
+        return False
+
+
+def _fast_uuid4() -> str:
+    """Format 16 random bytes as a version-4 UUID string.
+
+    Equivalent to str(uuid.uuid4()) but without importing the uuid module or
+    paying UUID.__init__'s field parsing for a value that is immediately
+    stringified; this keeps the uuid machinery off the tool's startup path.
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    h = b.hex()
+    return f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
+
+
+def create_new_machine_id(os_paths: dict, translator=None, created_dirs: Optional[set] = None) -> Optional[str]:
+    """Write a fresh random machine id where Cursor expects to find one."""
+    print(f"{Fore.CYAN}{EMOJI['RESET']} {translator.get('clear_data.new_machine_id') if translator else 'Creating new machine id...'}{Style.RESET_ALL}")
+    new_id = _fast_uuid4()
+    if not create_file_with_content(os_paths["machine_id_file"], new_id, created_dirs):
+        return None
+    return new_id
+
+
+def create_new_trial_info(os_paths: dict, translator=None, created_dirs: Optional[set] = None) -> Optional[dict]:
+    """Seed storage.json with fresh telemetry ids and a new trial start date."""
+    import json
+    from datetime import datetime
+
+    print(f"{Fore.CYAN}{EMOJI['RESET']} {translator.get('clear_data.new_trial_info') if translator else 'Creating new trial info...'}{Style.RESET_ALL}")
+    trial_info = {
+        "telemetry.devDeviceId": _fast_uuid4(),
+        "telemetry.macMachineId": _fast_uuid4(),
+        "telemetry.machineId": os.urandom(32).hex(),
+        "telemetry.sqmId": "{" + _fast_uuid4().upper() + "}",
+        "lastTrialStartDate": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    if not create_file_with_content(os_paths["storage_json"], json.dumps(trial_info, indent=4), created_dirs):
+        return None
+    return trial_info
+
+
+def reset_cursor(translator=None) -> bool:
+    """Remove all local Cursor data, then recreate machine id and trial info."""
+    home_dir = Path(os.path.expanduser("~"))
+    os_paths = get_os_paths(home_dir)
+    if os_paths is None:
+        print(f"{Fore.RED}{EMOJI['ERROR']} {translator.get('clear_data.unsupported_os', system=sys.platform) if translator else f'Unsupported operating system: {sys.platform}'}{Style.RESET_ALL}")
+        return False
+
+    allowed_bases = os_paths["allowed_bases"]
+    home_prefix = os.fspath(home_dir) + os.sep
+
+    # The config/cache/state targets are disjoint subtrees, so deleting them
+    # concurrently is safe, and the work is I/O-bound (syscalls and, for big
+    # trees, waiting on an rm/rd subprocess that releases the GIL).
+    all_paths = os_paths["config_dirs"] + os_paths["cache_dirs"] + os_paths["state_files"]
+
+    # Most candidates are speculative install locations that won't exist on
+    # any given machine. Grouping them by parent and listing each parent once
+    # trades one lstat per candidate for one getdents per directory.
+    by_parent = {}
+    for path in all_paths:
+        by_parent.setdefault(path.parent, []).append(path)
+    present_paths = []
+    for parent, candidates in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                present = {entry.name for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        present_paths.extend(p for p in candidates if p.name in present)
+
+    print(f"{Fore.CYAN}{EMOJI['INFO']} {translator.get('clear_data.removing_paths', count=len(present_paths)) if translator else f'Removing Cursor data ({len(present_paths)} of {len(all_paths)} candidate paths present)...'}{Style.RESET_ALL}")
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda p: remove_path(p, home_prefix, allowed_bases), present_paths))
+
+    created_dirs = set()
+    new_machine_id = create_new_machine_id(os_paths, translator, created_dirs)
+    new_trial_info = create_new_trial_info(os_paths, translator, created_dirs)
+
+    if new_machine_id and new_trial_info:
+        print(f"{Fore.GREEN}{EMOJI['SUCCESS']} {translator.get('clear_data.success') if translator else 'Cursor data cleared successfully.'}{Style.RESET_ALL}")
+        print(f"  {EMOJI['INFO']} machineId: {Fore.GREEN}{new_machine_id}{Style.RESET_ALL}")
+        print(f"  {EMOJI['INFO']} devDeviceId: {Fore.GREEN}{new_trial_info['telemetry.devDeviceId']}{Style.RESET_ALL}")
+        return True
+
+    print(f"{Fore.RED}{EMOJI['ERROR']} {translator.get('clear_data.recreate_failed') if translator else 'Failed to recreate machine id / trial info.'}{Style.RESET_ALL}")
+    return False
+
+
+def run(translator=None):
+    print(f"\n{Fore.CYAN}{'='*50}{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}{EMOJI['RESET']} {translator.get('clear_data.title') if translator else 'Clear Cursor Data'}{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}{'='*50}{Style.RESET_ALL}")
+    print(f"{Fore.YELLOW}{EMOJI['WARNING']} {translator.get('clear_data.warning') if translator else 'This will delete ALL local Cursor configuration, caches and state.'}{Style.RESET_ALL}")
+
+    try:
+        choice = input(f"{EMOJI['INFO']} {translator.get('clear_data.confirm') if translator else 'Are you sure? (y/N): '}").strip().lower()
+    except EOFError:
+        choice = "n"
+
+    if choice != "y":
+        print(f"{Fore.YELLOW}{EMOJI['INFO']} {translator.get('clear_data.cancelled') if translator else 'Cancelled.'}{Style.RESET_ALL}")
+        return False
+
+    return reset_cursor(translator)
+
+
+if __name__ == "__main__":
+    try:
+        run()
+    except Exception as e:
+        import traceback
+        print(f"{Fore.RED}{EMOJI['ERROR']} Unexpected error: {e}{Style.RESET_ALL}")
+        print(traceback.format_exc())